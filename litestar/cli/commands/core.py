@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import inspect
-import multiprocessing
 import os
 import subprocess
 import sys
-from typing import TYPE_CHECKING, Any, cast
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 import uvicorn
 from rich.tree import Tree
@@ -28,19 +28,30 @@ if TYPE_CHECKING:
     from litestar import Litestar
 
 
-def _convert_uvicorn_args(args: dict[str, Any]) -> list[str]:
-    process_args = []
-    for arg, value in args.items():
-        if isinstance(value, bool):
-            if value:
-                process_args.append(f"--{arg}")
-        elif isinstance(value, tuple):
-            for item in value:
-                process_args.append(f"--{arg}={item}")
-        else:
-            process_args.append(f"--{arg}={value}")
+def _convert_uvicorn_flag(arg: str, value: bool) -> list[str]:
+    return [f"--{arg}"] if value else []
+
+
+def _convert_uvicorn_multiple(arg: str, value: tuple[Any, ...]) -> list[str]:
+    return [f"--{arg}={item}" for item in value]
+
+
+def _convert_uvicorn_option(arg: str, value: Any) -> list[str]:
+    return [f"--{arg}={value}"]
 
-    return process_args
+
+_uvicorn_arg_converters: dict[type, Callable[[str, Any], list[str]]] = {
+    bool: _convert_uvicorn_flag,
+    tuple: _convert_uvicorn_multiple,
+}
+
+
+def _convert_uvicorn_args(args: dict[str, Any]) -> list[str]:
+    return [
+        process_arg
+        for arg, value in args.items()
+        for process_arg in _uvicorn_arg_converters.get(type(value), _convert_uvicorn_option)(arg, value)
+    ]
 
 
 @command(name="version")
@@ -66,7 +77,7 @@ def info_command(app: Litestar) -> None:
     "-wc",
     "--web-concurrency",
     help="The number of HTTP workers to launch",
-    type=click.IntRange(min=1, max=multiprocessing.cpu_count() + 1),
+    type=click.IntRange(min=1, max=(os.cpu_count() or 1) + 1),
     show_default=True,
     default=1,
 )
@@ -136,7 +147,8 @@ def run_command(
             factory=env.is_app_factory,
         )
     else:
-        # invoke uvicorn in a subprocess to be able to use the --reload flag. see
+        # run uvicorn through its own CLI, which replaces this process on POSIX and runs as a subprocess on Windows,
+        # to be able to use the --reload flag. see
         # https://github.com/litestar-org/litestar/issues/1191 and https://github.com/encode/uvicorn/issues/1045
         if sys.gettrace() is not None:
             console.print(
@@ -158,10 +170,15 @@ def run_command(
         if reload_dirs:
             process_args["reload-dir"] = reload_dirs
 
-        subprocess.run(
-            [sys.executable, "-m", "uvicorn", env.app_path, *_convert_uvicorn_args(process_args)],  # noqa: S603
-            check=True,
-        )
+        uvicorn_command = [sys.executable, "-m", "uvicorn", env.app_path, *_convert_uvicorn_args(process_args)]
+        if sys.platform == "win32":
+            # 'exec' on Windows spawns a new process and exits the current one, detaching the server from the console
+            subprocess.run(uvicorn_command, check=True)  # noqa: S603
+        else:
+            # replace the CLI process instead of keeping it alive as the parent of the server process
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, uvicorn_command)  # noqa: S606
 
 
 @command(name="routes")
@@ -170,7 +187,7 @@ def routes_command(app: Litestar) -> None:  # pragma: no cover
 
     tree = Tree("", hide_root=True)
 
-    for route in sorted(app.routes, key=lambda r: r.path):
+    for route in sorted(app.routes, key=attrgetter("path")):
         if isinstance(route, HTTPRoute):
             branch = tree.add(f"[green]{route.path}[/green] (HTTP)")
             for handler in route.route_handlers:
@@ -184,12 +201,13 @@ def routes_command(app: Litestar) -> None:  # pragma: no cover
                     handler_info.append("[yellow]sync[/yellow]")
 
                 handler_info.append(f'[cyan]{", ".join(sorted(handler.http_methods))}[/cyan]')
+                handler_label = " ".join(handler_info)
 
                 if len(handler.paths) > 1:
                     for path in handler.paths:
-                        branch.add(" ".join([f"[green]{path}[green]", *handler_info]))
+                        branch.add(f"[green]{path}[/green] {handler_label}")
                 else:
-                    branch.add(" ".join(handler_info))
+                    branch.add(handler_label)
 
         else:
             route_type = "WS" if isinstance(route, WebSocketRoute) else "ASGI"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -121,19 +122,25 @@ class TransferFieldDefinition(FieldDefinition):
         is_partial: bool,
         is_excluded: bool,
     ) -> Self:
-        return cls(
-            name=field_definition.name,
-            default=field_definition.default,
-            parsed_type=field_definition.parsed_type,
-            default_factory=field_definition.default_factory,
-            serialization_name=serialization_name,
-            unique_model_name=field_definition.unique_model_name,
-            transfer_type=transfer_type,
-            dto_field=field_definition.dto_field,
-            is_partial=is_partial,
-            is_excluded=is_excluded,
-            dto_for=field_definition.dto_for,
-        )
+        # this is called for every field of every model that a backend is built for, so we skip the generated
+        # ``__init__`` and its keyword argument binding, and set the frozen fields directly
+        instance = cls.__new__(cls)
+        set_attribute = object.__setattr__
+        set_attribute(instance, "name", field_definition.name)
+        set_attribute(instance, "default", field_definition.default)
+        set_attribute(instance, "parsed_type", field_definition.parsed_type)
+        set_attribute(instance, "default_factory", field_definition.default_factory)
+        set_attribute(instance, "unique_model_name", field_definition.unique_model_name)
+        set_attribute(instance, "dto_field", field_definition.dto_field)
+        set_attribute(instance, "dto_for", field_definition.dto_for)
+        set_attribute(instance, "transfer_type", transfer_type)
+        # renamed fields produce new, non-interned strings that are used as keys when transferring data. 'str.__str__()'
+        # turns 'str' subclasses, e.g. an enum member in 'rename_fields', into the plain 'str' that 'sys.intern()' and
+        # the transfer model factories require; 'str()' would return "Enum.MEMBER" for a 'str' mixin enum
+        set_attribute(instance, "serialization_name", sys.intern(str.__str__(serialization_name)))
+        set_attribute(instance, "is_partial", is_partial)
+        set_attribute(instance, "is_excluded", is_excluded)
+        return instance
 
 
 FieldDefinitionsType: TypeAlias = "tuple[TransferFieldDefinition, ...]"
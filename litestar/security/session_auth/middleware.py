@@ -105,15 +105,16 @@ class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
         Returns:
             :class:`AuthenticationResult <.middleware.authentication.AuthenticationResult>`
         """
-        if not connection.session or connection.session is Empty:  # type: ignore
+        session = connection.session
+        if session is Empty or not session:  # type: ignore[comparison-overlap]
             # the assignment of 'Empty' forces the session middleware to clear session data.
             connection.scope["session"] = Empty
             raise NotAuthorizedException("no session data found")
 
-        user = await self.retrieve_user_handler(connection.session, connection)
+        user = await self.retrieve_user_handler(session, connection)
 
         if not user:
             connection.scope["session"] = Empty
             raise NotAuthorizedException("no user correlating to session found")
 
-        return AuthenticationResult(user=user, auth=connection.session)
+        return AuthenticationResult(user=user, auth=session)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import re
 import typing as t
 from collections import abc, defaultdict, deque
+from functools import lru_cache
 from typing import (
     AbstractSet,
     Any,
@@ -11,7 +11,6 @@ from typing import (
     Dict,
     FrozenSet,
     Iterable,
-    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -42,13 +41,6 @@ __all__ = (
 T = TypeVar("T")
 UnionT = TypeVar("UnionT", bound="Union")
 
-tuple_types_regex = re.compile(
-    "^"
-    + "|".join(
-        [*[repr(x) for x in (List, Sequence, Iterable, Iterator, Tuple, Deque)], "tuple", "list", "collections.deque"]
-    )
-)
-
 instantiable_type_mapping = {
     AbstractSet: set,
     DefaultDict: defaultdict,
@@ -115,13 +107,42 @@ This is necessary because occasionally we want to rebuild a generic outer type w
 ``collections.abc.Mapping``, are not valid generic types in Python 3.8.
 """
 
+_instantiable_type_mapping_get = instantiable_type_mapping.get
+_safe_generic_origin_map_get = _safe_generic_origin_map.get
+
 wrapper_type_set = {Annotated, Required, NotRequired}
 """Types that always contain a wrapped type annotation as their first arg."""
 
+_empty_wrapper_set: frozenset[Any] = frozenset()
+"""Returned by :func:`unwrap_annotation` for annotations without wrapper types, to spare allocating a new set."""
+
+_iterable_origin_set = frozenset(
+    (
+        abc.Collection,
+        abc.Generator,
+        abc.Iterable,
+        abc.Iterator,
+        abc.MutableSequence,
+        abc.MutableSet,
+        abc.Sequence,
+        abc.Set,
+        deque,
+        frozenset,
+        list,
+        set,
+        tuple,
+    )
+)
+"""Origins of the generics whose first arg is their item type, e.g. ``List[int]``, ``Set[int]`` or ``tuple[int, ...]``.
+
+Mappings are excluded, as their first arg is the key type, and so are async iterables, as they are not
+:class:`Iterable <typing.Iterable>`.
+"""
+
 
 def normalize_type_annotation(annotation: Any) -> Any:
     """Normalize a type annotation to a standard form."""
-    return instantiable_type_mapping.get(annotation, annotation)
+    return _instantiable_type_mapping_get(annotation, annotation)
 
 
 def annotation_is_iterable_of_type(
@@ -139,10 +160,7 @@ def annotation_is_iterable_of_type(
     """
     from litestar.utils.predicates import is_class_and_subclass
 
-    if (args := get_args(annotation)) and (
-        isinstance(annotation, (List, Sequence, Iterable, Iterator, Tuple, Deque, tuple, list, deque))  # type: ignore
-        or tuple_types_regex.match(repr(annotation))
-    ):
+    if get_origin(annotation) in _iterable_origin_set and (args := get_args(annotation)):
         return args[0] is type_value or isinstance(args[0], type_value) or is_class_and_subclass(args[0], type_value)
     return False
 
@@ -169,21 +187,24 @@ def unwrap_union(annotation: Any) -> tuple[Any, ...]:
     Returns:
         A tuple of annotations
     """
-    from litestar.utils.predicates import is_optional_union, is_union
+    from litestar.utils.predicates import is_union
 
     args: list[Any] = []
-
-    for arg in get_args(annotation):
-        arg_value = get_origin_or_inner_type(arg) or arg
-        if is_optional_union(arg_value) or is_union(arg_value):
-            args.extend(unwrap_union(arg_value))
+    # nested unions, e.g. ``Annotated[Union[str, bytes], ...]``, are unwrapped depth-first, so args are pushed in
+    # reverse to preserve their order
+    stack = list(reversed(get_args(annotation)))
+
+    while stack:
+        arg = stack.pop()
+        if is_union(arg):
+            stack.extend(reversed(get_args(unwrap_annotation(arg)[0])))
         else:
-            args.append(arg_value)
+            args.append(get_origin_or_inner_type(arg) or arg)
 
     return tuple(args)
 
 
-def unwrap_annotation(annotation: Any) -> tuple[Any, tuple[Any, ...], set[Any]]:
+def unwrap_annotation(annotation: Any) -> tuple[Any, tuple[Any, ...], AbstractSet[Any]]:
     """Remove "wrapper" annotation types, such as ``Annotated``, ``Required``, and ``NotRequired``.
 
     Note:
@@ -197,6 +218,9 @@ def unwrap_annotation(annotation: Any) -> tuple[Any, tuple[Any, ...], set[Any]]:
         A tuple of the unwrapped annotation and any ``Annotated`` metadata, and a set of any wrapper types encountered.
     """
     origin = get_origin(annotation)
+    if origin not in wrapper_type_set:
+        return annotation, (), _empty_wrapper_set
+
     wrappers = set()
     metadata = []
     while origin in wrapper_type_set:
@@ -216,13 +240,27 @@ def get_origin_or_inner_type(annotation: Any) -> Any:
     Returns:
         Any type.
     """
+    if get_origin(annotation) in wrapper_type_set:
+        # wrapper types compare equal whenever their inner types do, e.g. ``Annotated[int | str, ...]`` and
+        # ``Annotated[Union[int, str], ...]``, so a cached origin could belong to the other one
+        return _get_origin_or_inner_type.__wrapped__(annotation)
+    try:
+        return _get_origin_or_inner_type(annotation)
+    except TypeError:
+        # annotations with unhashable metadata, e.g. ``List[Annotated[int, {"a": 1}]]`` cannot be cached
+        return _get_origin_or_inner_type.__wrapped__(annotation)
+
+
+# 'typed' keeps ``int | str`` and ``Union[int, str]`` apart, they compare and hash equal but have different origins
+@lru_cache(2048, typed=True)
+def _get_origin_or_inner_type(annotation: Any) -> Any:
     origin = get_origin(annotation)
-    if origin in wrapper_type_set:
-        inner, _, _ = unwrap_annotation(annotation)
-        # we need to recursively call here 'get_origin_or_inner_type' because we might be dealing with a generic type alias
-        # e.g. Annotated[dict[str, list[int]]
-        origin = get_origin_or_inner_type(inner)
-    return instantiable_type_mapping.get(origin, origin)
+    # same walk as 'unwrap_annotation', but without collecting metadata - we only need the origin of the inner type,
+    # e.g. 'dict' for Annotated[dict[str, list[int]], ...]
+    while origin in wrapper_type_set:
+        annotation = get_args(annotation)[0]
+        origin = get_origin(annotation)
+    return _instantiable_type_mapping_get(origin, origin)
 
 
 def get_safe_generic_origin(origin_type: Any) -> Any:
@@ -234,4 +272,4 @@ def get_safe_generic_origin(origin_type: Any) -> Any:
     Returns:
         The ``typing`` module equivalent of the given type, if it exists. Otherwise, the original type is returned.
     """
-    return _safe_generic_origin_map.get(origin_type, origin_type)
+    return _safe_generic_origin_map_get(origin_type, origin_type)
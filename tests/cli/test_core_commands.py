@@ -27,6 +27,11 @@ def mock_subprocess_run(mocker: MockerFixture) -> MagicMock:
     return mocker.patch("litestar.cli.commands.core.subprocess.run")
 
 
+@pytest.fixture()
+def mock_execv(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("litestar.cli.commands.core.os.execv")
+
+
 @pytest.fixture()
 def mock_uvicorn_run(mocker: MockerFixture) -> MagicMock:
     return mocker.patch("litestar.cli.commands.core.uvicorn.run")
@@ -63,6 +68,7 @@ def test_run_command(
     create_app_file: CreateAppFileFixture,
     set_in_env: bool,
     mock_subprocess_run: MagicMock,
+    mock_execv: MagicMock,
     mock_uvicorn_run: MagicMock,
     tmp_project_dir: Path,
 ) -> None:
@@ -154,10 +160,18 @@ def test_run_command(
             expected_args.append(f"--workers={web_concurrency}")
         if reload_dir:
             expected_args.extend([f"--reload-dir={s}" for s in reload_dir])
-        mock_subprocess_run.assert_called_once()
-        assert sorted(mock_subprocess_run.call_args_list[0].args[0]) == sorted(expected_args)
+        if sys.platform == "win32":
+            mock_execv.assert_not_called()
+            mock_subprocess_run.assert_called_once()
+            assert sorted(mock_subprocess_run.call_args_list[0].args[0]) == sorted(expected_args)
+        else:
+            mock_subprocess_run.assert_not_called()
+            mock_execv.assert_called_once()
+            assert mock_execv.call_args_list[0].args[0] == sys.executable
+            assert sorted(mock_execv.call_args_list[0].args[1]) == sorted(expected_args)
     else:
         mock_subprocess_run.assert_not_called()
+        mock_execv.assert_not_called()
         mock_uvicorn_run.assert_called_once_with(
             app=f"{path.stem}:app", host=host, port=port, uds=uds, fd=fd, factory=False
         )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 import pytest
 from sqlalchemy import ForeignKey, String
@@ -12,6 +12,9 @@ from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO
 from litestar.dto.factory import DTOConfig
 from litestar.dto.factory._backends.utils import RenameStrategies
 from litestar.dto.factory.types import RenameStrategy
+from litestar.enums import MediaType
+from litestar.handlers.http_handlers import HTTPRouteHandler
+from litestar.serialization import encode_json
 from litestar.testing import create_test_client
 
 
@@ -59,82 +62,108 @@ class BookAuthorTestData:
     book_review: str = "Excellent!"
 
 
-@pytest.fixture
-def book_json_data() -> Callable[[RenameStrategy, BookAuthorTestData], Tuple[Dict[str, Any], Book]]:
-    def _generate(rename_strategy: RenameStrategy, test_data: BookAuthorTestData) -> Tuple[Dict[str, Any], Book]:
-        data: Dict[str, Any] = {
-            RenameStrategies(rename_strategy)("id"): test_data.book_id,
-            RenameStrategies(rename_strategy)("title"): test_data.book_title,
-            RenameStrategies(rename_strategy)("author_id"): test_data.book_author_id,
-            RenameStrategies(rename_strategy)("bar"): test_data.book_bar,
-            RenameStrategies(rename_strategy)("SPAM"): test_data.book_SPAM,
-            RenameStrategies(rename_strategy)("spam_bar"): test_data.book_spam_bar,
-            RenameStrategies(rename_strategy)("first_author"): {
-                RenameStrategies(rename_strategy)("id"): test_data.book_author_id,
-                RenameStrategies(rename_strategy)("name"): test_data.book_author_name,
-                RenameStrategies(rename_strategy)("date_of_birth"): test_data.book_author_date_of_birth,
-            },
-            RenameStrategies(rename_strategy)("reviews"): [
-                {
-                    RenameStrategies(rename_strategy)("book_id"): test_data.book_id,
-                    RenameStrategies(rename_strategy)("id"): test_data.book_review_id,
-                    RenameStrategies(rename_strategy)("review"): test_data.book_review,
-                }
-            ],
-        }
-        book = Book(
-            id=test_data.book_id,
-            title=test_data.book_title,
-            author_id=test_data.book_author_id,
-            bar=test_data.book_bar,
-            SPAM=test_data.book_SPAM,
-            spam_bar=test_data.book_spam_bar,
-            first_author=Author(
-                id=test_data.book_author_id,
-                name=test_data.book_author_name,
-                date_of_birth=test_data.book_author_date_of_birth,
-            ),
-            reviews=[
-                BookReview(id=test_data.book_review_id, review=test_data.book_review, book_id=test_data.book_id),
-            ],
-        )
-        return data, book
-
-    return _generate
-
-
-@pytest.mark.parametrize(
-    "rename_strategy",
-    [
-        ("camel"),
-    ],
+FIELD_NAMES = (
+    "id",
+    "title",
+    "author_id",
+    "bar",
+    "SPAM",
+    "spam_bar",
+    "first_author",
+    "reviews",
+    "name",
+    "date_of_birth",
+    "book_id",
+    "review",
 )
-def test_fields_alias_generator_sqlalchemy(
-    rename_strategy: RenameStrategy,
-    book_json_data: Callable[[RenameStrategy, BookAuthorTestData], Tuple[Dict[str, Any], Book]],
-) -> None:
+RENAME_STRATEGIES: Tuple[RenameStrategy, ...] = ("lower", "upper", "camel", "pascal")
+RENAMED_FIELD_NAMES: Dict[RenameStrategy, Dict[str, str]] = {
+    strategy: {name: RenameStrategies(strategy)(name) for name in FIELD_NAMES} for strategy in RENAME_STRATEGIES
+}
+BOOK_DTOS: Dict[RenameStrategy, Type[SQLAlchemyDTO[Book]]] = {
+    strategy: SQLAlchemyDTO[Annotated[Book, DTOConfig(rename_strategy=strategy)]] for strategy in RENAME_STRATEGIES
+}
+
+
+def _generate_book_data(rename_strategy: RenameStrategy, test_data: BookAuthorTestData) -> Tuple[Dict[str, Any], Book]:
+    field_names = RENAMED_FIELD_NAMES[rename_strategy]
+    data: Dict[str, Any] = {
+        field_names["id"]: test_data.book_id,
+        field_names["title"]: test_data.book_title,
+        field_names["author_id"]: test_data.book_author_id,
+        field_names["bar"]: test_data.book_bar,
+        field_names["SPAM"]: test_data.book_SPAM,
+        field_names["spam_bar"]: test_data.book_spam_bar,
+        field_names["first_author"]: {
+            field_names["id"]: test_data.book_author_id,
+            field_names["name"]: test_data.book_author_name,
+            field_names["date_of_birth"]: test_data.book_author_date_of_birth,
+        },
+        field_names["reviews"]: [
+            {
+                field_names["book_id"]: test_data.book_id,
+                field_names["id"]: test_data.book_review_id,
+                field_names["review"]: test_data.book_review,
+            }
+        ],
+    }
+    book = Book(
+        id=test_data.book_id,
+        title=test_data.book_title,
+        author_id=test_data.book_author_id,
+        bar=test_data.book_bar,
+        SPAM=test_data.book_SPAM,
+        spam_bar=test_data.book_spam_bar,
+        first_author=Author(
+            id=test_data.book_author_id,
+            name=test_data.book_author_name,
+            date_of_birth=test_data.book_author_date_of_birth,
+        ),
+        reviews=[
+            BookReview(id=test_data.book_review_id, review=test_data.book_review, book_id=test_data.book_id),
+        ],
+    )
+    return data, book
+
+
+@pytest.fixture(scope="module")
+def book_json_data() -> Dict[RenameStrategy, Tuple[Dict[str, Any], Book]]:
     test_data = BookAuthorTestData()
-    json_data, instance = book_json_data(rename_strategy, test_data)
-    config = DTOConfig(rename_strategy=rename_strategy)
-    dto = SQLAlchemyDTO[Annotated[Book, config]]
+    return {rename_strategy: _generate_book_data(rename_strategy, test_data) for rename_strategy in RENAME_STRATEGIES}
+
 
-    @post(dto=dto, signature_namespace={"Book": Book})
+def _create_book_handlers(rename_strategy: RenameStrategy, instance: Book) -> List[HTTPRouteHandler]:
+    dto = BOOK_DTOS[rename_strategy]
+
+    @post(f"/{rename_strategy}", dto=dto, signature_namespace={"Book": Book})
     def post_handler(data: Book) -> Book:
         return data
 
-    @get(dto=dto, signature_namespace={"Book": Book})
+    @get(f"/{rename_strategy}", dto=dto, signature_namespace={"Book": Book})
     def get_handler() -> Book:
         return instance
 
-    with create_test_client(
-        route_handlers=[post_handler, get_handler],
-        debug=True,
-    ) as client:
-        response_callback = client.get("/")
-        assert response_callback.json() == json_data
+    return [post_handler, get_handler]
+
+
+def test_fields_alias_generator_sqlalchemy(
+    book_json_data: Dict[RenameStrategy, Tuple[Dict[str, Any], Book]],
+) -> None:
+    route_handlers = [
+        route_handler
+        for rename_strategy, (_, instance) in book_json_data.items()
+        for route_handler in _create_book_handlers(rename_strategy, instance)
+    ]
+
+    with create_test_client(route_handlers=route_handlers) as client:
+        for rename_strategy, (json_data, _) in book_json_data.items():
+            response_callback = client.get(f"/{rename_strategy}")
+            assert response_callback.json() == json_data
 
-        response_callback = client.post("/", json=json_data)
-        assert response_callback.json() == json_data
+            response_callback = client.post(
+                f"/{rename_strategy}", content=encode_json(json_data), headers={"content-type": MediaType.JSON.value}
+            )
+            assert response_callback.json() == json_data
 
 
 def test_dto_with_association_proxy(create_module: Callable[[str], ModuleType]) -> None:
@@ -190,7 +219,7 @@ def get_handler() -> User:
 """
     )
 
-    with create_test_client(route_handlers=[module.get_handler], debug=True) as client:
+    with create_test_client(route_handlers=[module.get_handler]) as client:
         response = client.get("/")
         assert response.json() == {"id": 1, "keywords": ["bar", "baz"]}
 
@@ -230,7 +259,7 @@ def get_handler() -> Interval:
 """
     )
 
-    with create_test_client(route_handlers=[module.get_handler], debug=True) as client:
+    with create_test_client(route_handlers=[module.get_handler]) as client:
         response = client.get("/")
         assert response.json() == {"id": 1, "start": 1, "end": 3, "length": 2}
 
@@ -275,7 +304,7 @@ def get_handler() -> Interval:
 """
     )
 
-    with create_test_client(route_handlers=[module.get_handler], debug=True) as client:
+    with create_test_client(route_handlers=[module.get_handler]) as client:
         response = client.get("/")
         assert response.json() == {"id": 1, "start": 1, "end": 3, "length": 2}
 
@@ -325,7 +354,7 @@ def get_handler(data: Circle) -> Circle:
 """
     )
 
-    with create_test_client(route_handlers=[module.get_handler], debug=True) as client:
+    with create_test_client(route_handlers=[module.get_handler]) as client:
         response = client.post("/", json={"radius": 5})
         assert response.json() == {"id": 1, "radius": 5}
         assert module.DIAMETER == 10
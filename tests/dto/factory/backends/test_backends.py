@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import Enum
 from types import ModuleType
 from typing import TYPE_CHECKING, Callable, List, Optional
 
@@ -13,6 +14,7 @@ from litestar.dto.factory import DTOConfig
 from litestar.dto.factory._backends import MsgspecDTOBackend, PydanticDTOBackend
 from litestar.dto.factory._backends.abc import BackendContext
 from litestar.dto.factory._backends.types import CollectionType, SimpleType, TransferFieldDefinition
+from litestar.dto.factory.data_structures import FieldDefinition
 from litestar.dto.factory.stdlib.dataclass import DataclassDTO
 from litestar.dto.interface import ConnectionContext
 from litestar.enums import MediaType
@@ -204,6 +206,59 @@ def test_backend_model_name_uniqueness(backend_type: type[AbstractDTOBackend], b
         unique_names.add(model_name)
 
 
+def test_transfer_field_definition_from_field_definition() -> None:
+    transfer_type = SimpleType(parsed_type=ParsedType(int), nested_field_info=None)
+    field_definition = FieldDefinition(
+        name="a",
+        default=1,
+        parsed_type=ParsedType(int),
+        default_factory=None,
+        dto_field=None,
+        unique_model_name="some_module.SomeModel",
+        dto_for="data",
+    )
+    assert TransferFieldDefinition.from_field_definition(
+        field_definition, transfer_type=transfer_type, serialization_name="b", is_partial=True, is_excluded=False
+    ) == TransferFieldDefinition(
+        name="a",
+        default=1,
+        parsed_type=ParsedType(int),
+        default_factory=None,
+        dto_field=None,
+        unique_model_name="some_module.SomeModel",
+        serialization_name="b",
+        transfer_type=transfer_type,
+        is_partial=True,
+        is_excluded=False,
+        dto_for="data",
+    )
+
+
+class RenamedField(str, Enum):
+    OPTIONAL = "renamed_optional"
+
+
+@pytest.mark.parametrize("backend_type", [MsgspecDTOBackend, PydanticDTOBackend])
+def test_backend_str_subclass_rename(
+    backend_type: type[AbstractDTOBackend], connection_context: ConnectionContext
+) -> None:
+    ctx = BackendContext(
+        DTOConfig(rename_fields={"optional": RenamedField.OPTIONAL}),
+        "data",
+        ParsedType(DC),
+        DataclassDTO.generate_field_definitions,
+        DataclassDTO.detect_nested_field,
+        DC,
+    )
+    backend = backend_type(ctx)
+    builtins = dict(DESTRUCTURED)
+    builtins["renamed_optional"] = builtins.pop("optional")
+    assert backend.populate_data_from_builtins(builtins=builtins, connection_context=connection_context) == STRUCTURED
+    assert encode_json(backend.encode_data(STRUCTURED, connection_context)) == RAW.replace(
+        b'"optional"', b'"renamed_optional"'
+    )
+
+
 @pytest.mark.parametrize("backend_type", [MsgspecDTOBackend, PydanticDTOBackend])
 def test_backend_populate_data_from_raw(
     backend_type: type[AbstractDTOBackend], backend_context: BackendContext, connection_context: ConnectionContext
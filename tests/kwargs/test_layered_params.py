@@ -1,14 +1,19 @@
-from typing import List
+from typing import Generator, List
 
 import pytest
 
 from litestar import Controller, Router, get
 from litestar.params import Parameter
 from litestar.status_codes import HTTP_200_OK, HTTP_400_BAD_REQUEST
-from litestar.testing import create_test_client
+from litestar.testing import TestClient, create_test_client
 
+LAYERED_QUERY = {"controller1": "99", "controller3": "tuna", "router1": "albatross", "app2": ["x", "y"]}
+LAYERED_HEADERS = {"router3": "10"}
+LAYERED_COOKIES = {"app4": "jeronimo"}
 
-def test_layered_parameters_injected_correctly() -> None:
+
+@pytest.fixture(scope="module")
+def layered_client() -> Generator[TestClient, None, None]:
     class MyController(Controller):
         path = "/controller"
         parameters = {"controller1": Parameter(lt=100), "controller2": Parameter(str, query="controller3")}
@@ -33,47 +38,17 @@ def test_layered_parameters_injected_correctly() -> None:
             assert isinstance(app2, list)
             return {"message": "ok"}
 
-    router = Router(
-        path="/router",
-        route_handlers=[MyController],
-        parameters={
-            "router1": Parameter(str, pattern="^[a-zA-Z]$"),
-            "router2": Parameter(float, multiple_of=5.0, header="router3"),
-        },
-    )
-
-    with create_test_client(
-        route_handlers=router,
-        parameters={
-            "app1": Parameter(str, cookie="app4"),
-            "app2": Parameter(List[str], min_items=2),
-            "app3": Parameter(bool, required=False),
-        },
-    ) as client:
-        # Set cookies on the client to avoid warnings about per-request cookies.
-        client.cookies = {"app4": "jeronimo"}  # type: ignore
-
-        query = {"controller1": "99", "controller3": "tuna", "router1": "albatross", "app2": ["x", "y"]}
-        headers = {"router3": "10"}
-
-        response = client.get("/router/controller/1", params=query, headers=headers)
-        assert response.json() == {"message": "ok"}
-        assert response.status_code == HTTP_200_OK
-
-
-@pytest.mark.parametrize("parameter", ["controller1", "controller3", "router1", "router3", "app4", "app2"])
-def test_layered_parameters_validation(parameter: str) -> None:
-    class MyController(Controller):
+    class BareController(Controller):
         path = "/controller"
         parameters = {"controller1": Parameter(int, lt=100), "controller2": Parameter(str, query="controller3")}
 
-        @get("/{local:int}")
+        @get("/{local:int}/bare")
         def my_handler(self) -> dict:
             return {}
 
     router = Router(
         path="/router",
-        route_handlers=[MyController],
+        route_handlers=[MyController, BareController],
         parameters={
             "router1": Parameter(str, pattern="^[a-zA-Z]$"),
             "router2": Parameter(float, multiple_of=5.0, header="router3"),
@@ -88,24 +63,38 @@ def test_layered_parameters_validation(parameter: str) -> None:
             "app3": Parameter(bool, required=False),
         },
     ) as client:
-        query = {"controller1": "99", "controller3": "tuna", "router1": "albatross", "app2": ["x", "y"]}
-        headers = {"router3": "10"}
-        cookies = {"app4": "jeronimo"}
+        yield client
+
+
+def test_layered_parameters_injected_correctly(layered_client: TestClient) -> None:
+    # Set cookies on the client to avoid warnings about per-request cookies.
+    layered_client.cookies = LAYERED_COOKIES  # type: ignore
+
+    response = layered_client.get("/router/controller/1", params=LAYERED_QUERY, headers=LAYERED_HEADERS)
+    assert response.json() == {"message": "ok"}
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.parametrize("parameter", ["controller1", "controller3", "router1", "router3", "app4", "app2"])
+def test_layered_parameters_validation(layered_client: TestClient, parameter: str) -> None:
+    query = dict(LAYERED_QUERY)
+    headers = dict(LAYERED_HEADERS)
+    cookies = dict(LAYERED_COOKIES)
 
-        if parameter in headers:
-            headers = {}
-        elif parameter in cookies:
-            cookies = {}
-        else:
-            query.pop(parameter)
+    if parameter in headers:
+        headers = {}
+    elif parameter in cookies:
+        cookies = {}
+    else:
+        query.pop(parameter)
 
-        # Set cookies on the client to avoid warnings about per-request cookies.
-        client.cookies = cookies  # type: ignore
+    # Set cookies on the client to avoid warnings about per-request cookies.
+    layered_client.cookies = cookies  # type: ignore
 
-        response = client.get("/router/controller/1", params=query, headers=headers)
+    response = layered_client.get("/router/controller/1/bare", params=query, headers=headers)
 
-        assert response.status_code == HTTP_400_BAD_REQUEST
-        assert f"Missing required parameter {parameter}" in response.json()["detail"]
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert f"Missing required parameter {parameter}" in response.json()["detail"]
 
 
 def test_layered_parameters_defaults_and_overrides() -> None:
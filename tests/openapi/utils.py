@@ -40,13 +40,14 @@ constrained_numbers = [
     condecimal(gt=Decimal("10"), lt=Decimal("100"), multiple_of=Decimal("5")),
     condecimal(ge=Decimal("10"), le=Decimal("100"), multiple_of=Decimal("2")),
 ]
+alpha_regex = "^[a-zA-Z]$"
+
 constrained_string = [
-    constr(regex="^[a-zA-Z]$"),
-    constr(to_upper=True, min_length=1, regex="^[a-zA-Z]$"),
-    constr(to_lower=True, min_length=1, regex="^[a-zA-Z]$"),
-    constr(to_lower=True, min_length=10, regex="^[a-zA-Z]$"),
-    constr(to_lower=True, min_length=10, max_length=100, regex="^[a-zA-Z]$"),
-    constr(min_length=1),
+    constr(regex=alpha_regex),
+    constr(to_upper=True, min_length=1, regex=alpha_regex),
+    constr(to_lower=True, min_length=1, regex=alpha_regex),
+    constr(to_lower=True, min_length=10, regex=alpha_regex),
+    constr(to_lower=True, min_length=10, max_length=100, regex=alpha_regex),
     constr(min_length=1),
     constr(min_length=10),
     constr(min_length=10, max_length=100),
@@ -64,9 +65,8 @@ constrained_collection = [
     conset(int, min_items=1),
     conset(int, min_items=1, max_items=10),
 ]
+today = date.today()
 constrained_dates = [
-    condate(gt=date.today() - timedelta(days=10), lt=date.today() + timedelta(days=100)),
-    condate(ge=date.today() - timedelta(days=10), le=date.today() + timedelta(days=100)),
-    condate(gt=date.today() - timedelta(days=10), lt=date.today() + timedelta(days=100)),
-    condate(ge=date.today() - timedelta(days=10), le=date.today() + timedelta(days=100)),
+    condate(gt=today - timedelta(days=10), lt=today + timedelta(days=100)),
+    condate(ge=today - timedelta(days=10), le=today + timedelta(days=100)),
 ]
@@ -2,12 +2,37 @@ from __future__ import annotations
 
 from collections import deque
 from sys import version_info
-from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pytest
-from typing_extensions import Annotated
+from typing_extensions import Annotated, NotRequired
 
-from litestar.utils.typing import annotation_is_iterable_of_type, get_origin_or_inner_type, make_non_optional_union
+from litestar.types.builtin_types import NoneType
+from litestar.utils.typing import (
+    _get_origin_or_inner_type,
+    annotation_is_iterable_of_type,
+    get_origin_or_inner_type,
+    make_non_optional_union,
+    unwrap_union,
+)
 from tests import Person, Pet
 
 if version_info >= (3, 10):
@@ -15,9 +40,12 @@ if version_info >= (3, 10):
         (tuple[Person, ...], True),
         (list[Person], True),
         (deque[Person], True),
+        (set[Person], True),
+        (frozenset[Person], True),
         (tuple[Pet, ...], False),
         (list[Pet], False),
         (deque[Pet], False),
+        (dict[Person, int], False),
     ]
 else:
     py_310_plus_annotation = []
@@ -31,11 +59,20 @@ else:
         (Iterable[Person], True),
         (Tuple[Person, ...], True),
         (Deque[Person], True),
+        (Set[Person], True),
+        (FrozenSet[Person], True),
+        (MutableSequence[Person], True),
+        (Collection[Person], True),
+        (Generator[Person, None, None], True),
         (List[Pet], False),
         (Sequence[Pet], False),
         (Iterable[Pet], False),
         (Tuple[Pet, ...], False),
         (Deque[Pet], False),
+        (Set[Pet], False),
+        (Dict[Person, int], False),
+        (Mapping[Person, int], False),
+        (AsyncIterator[Person], False),
         *py_310_plus_annotation,
         (int, False),
         (str, False),
@@ -57,3 +94,41 @@ def test_get_origin_or_inner_type() -> None:
     assert get_origin_or_inner_type(List[Person]) == list
     assert get_origin_or_inner_type(Annotated[List[Person], "foo"]) == list
     assert get_origin_or_inner_type(Annotated[Dict[str, List[Person]], "foo"]) == dict
+    assert get_origin_or_inner_type(NotRequired[Annotated[List[Person], "foo"]]) == list
+    assert get_origin_or_inner_type(Person) is None
+
+
+def test_get_origin_or_inner_type_unhashable_metadata() -> None:
+    assert get_origin_or_inner_type(Annotated[List[Person], {"foo": "bar"}]) == list
+
+
+@pytest.mark.skipif(version_info < (3, 10), reason="union operator requires python 3.10+")
+@pytest.mark.parametrize("wrap", [lambda annotation: annotation, lambda annotation: Annotated[annotation, "foo"]])
+@pytest.mark.parametrize("pep_604_first", [True, False])
+def test_get_origin_or_inner_type_keeps_union_forms_apart(wrap: Callable[[Any], Any], pep_604_first: bool) -> None:
+    from types import UnionType
+
+    _get_origin_or_inner_type.cache_clear()
+    pep_604_union, typing_union = wrap(int | str), wrap(Union[int, str])
+    for annotation in (pep_604_union, typing_union) if pep_604_first else (typing_union, pep_604_union):
+        get_origin_or_inner_type(annotation)
+
+    assert get_origin_or_inner_type(pep_604_union) is UnionType
+    assert get_origin_or_inner_type(typing_union) is Union
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (Union[int, str], (int, str)),
+        (Optional[List[Person]], (list, NoneType)),
+        (Union[Dict[str, int], Annotated[Tuple[int, ...], "foo"], None], (dict, tuple, NoneType)),
+        (Union[int, Annotated[Union[str, bytes], "foo"]], (int, str, bytes)),
+        (
+            Union[Annotated[Union[str, List[int]], "foo"], None, Annotated[Optional[float], "bar"]],
+            (str, list, NoneType, float, NoneType),
+        ),
+    ],
+)
+def test_unwrap_union(annotation: Any, expected: Any) -> None:
+    assert unwrap_union(annotation) == expected